@@ -35,10 +35,13 @@ from blessed import Terminal
 # Initialize terminal colors for colorama.
 init()
 
+# The Console singleton is kept at module level: Console.instance() is called a lot
+# (every Sprixel and Text creation for example) and a global lookup is cheaper than a
+# (name mangled) class attribute lookup.
+_CONSOLE_INSTANCE = None
 
-class Console:
-    __instance = None
 
+class Console:
     @classmethod
     def instance(cls):
         """Returns the instance of the Terminal object
@@ -56,9 +59,10 @@ class Console:
         term = Console.instance()
 
         """
-        if cls.__instance is None:
-            cls.__instance = Terminal()
-        return cls.__instance
+        global _CONSOLE_INSTANCE
+        if _CONSOLE_INSTANCE is None:
+            _CONSOLE_INSTANCE = Terminal()
+        return _CONSOLE_INSTANCE
 
 
 class Text(object):
@@ -290,9 +290,11 @@ class BoardItem(object):
         buffer[row][column] = self.sprixel.__repr__()
         incr = self.sprixel.length
         if incr > 1:
+            # Blank the cells covered by a wide sprixel in one slice assignment instead
+            # of a Python loop.
+            start = column + 1
             end = min(column + incr, width)
-            for idx in range(column + 1, end):
-                buffer[row][idx] = ""
+            buffer[row][start:end] = [""] * (end - start)
 
     def can_move(self):
         """
@@ -577,11 +579,17 @@ class BoardComplexItem(BoardItem):
         # For optimization's sakes we directly loop through the right places in the
         # buffer and simply translate the coordinates back to the sprite.
         # The loops takes clamped value to not render anything out of the buffer.
-        for sr in range(row, min(self.sprite.size[1] + row, height)):
-            for sc in range(column, min(self.sprite.size[0] + column, width)):
+        # Since they are clamped, we can index the sprixels directly.
+        sprite = self.sprite
+        sprixels = sprite._sprixels
+        col_end = min(sprite.size[0] + column, width)
+        for sr in range(row, min(sprite.size[1] + row, height)):
+            sprixels_row = sprixels[sr - row]
+            buffer_row = buffer[sr]
+            for sc in range(column, col_end):
                 # TODO: If the Sprite has sprixels with length > 1 this is going to be
                 # A mess.
-                buffer[sr][sc] = self.sprite.sprixel(sr - row, sc - column).__repr__()
+                buffer_row[sc] = sprixels_row[sc - column].__repr__()
 
 
 class Movable(BoardItem):
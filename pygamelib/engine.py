@@ -34,6 +34,9 @@ import numpy as np
 # We need to ignore that one as it is used by user to compare keys (i.e Utils.key.UP)
 from readchar import readkey, key  # noqa: F401
 
+# Singleton instance of the Game object (see Game.instance()).
+_GAME_INSTANCE = None
+
 
 class Board:
     """A class that represent a game board.
@@ -672,16 +675,16 @@ class Board:
         for br in range(row_start, row_end):
             cidx = 0
             bc = bc_start
+            buffer_row = buffer[row + br - row_start]
             while bc < column_end:
                 cell = render_cell(br, bc)
-                encoded_cell = cell.__repr__()
                 incr = cell.length
-                buffer[row + br - row_start][column + cidx] = encoded_cell
-
-                # That if serves no purpose aside from slowing us
-                # down... if incr > 1:
-                for tmpiidx in range(1, incr):
-                    buffer[row + br][column + cidx + tmpiidx] = ""
+                buffer_row[column + cidx] = cell.__repr__()
+                if incr > 1:
+                    # Wide sprixels: blank the covered cells with one slice assignment.
+                    start = column + cidx + 1
+                    end = min(column + cidx + incr, buffer_width)
+                    buffer_row[start:end] = [""] * (end - start)
                 bc += 1
                 cidx += incr
 
@@ -1401,8 +1404,6 @@ class Game:
     # subjected to physic by setting the ignore_physic attribute to True. It is the
     # default for :class:`pygamelib.board_items.Projectile` objects.
 
-    __instance = None  # Class variable stores the singleton instance of Game object
-
     def __init__(
         self,
         name="Game",
@@ -1463,9 +1464,10 @@ class Game:
         :return: Instance of Game object
 
         """
-        if cls.__instance is None:
-            cls.__instance = cls(*args, **kwargs)
-        return cls.__instance
+        global _GAME_INSTANCE
+        if _GAME_INSTANCE is None:
+            _GAME_INSTANCE = cls(*args, **kwargs)
+        return _GAME_INSTANCE
 
     def run(self):
         """
@@ -3270,18 +3272,14 @@ class Screen(object):
         super().__init__()
         # get a terminal instance
         self.terminal = base.Console.instance()
-        # Create the 2 buffers.
-        self._display_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.terminal.width, 1)]
-                for j in range(0, self.terminal.height, 1)
-            ]
+        # Create the 2 buffers. All the blank cells share the same Sprixel so we let
+        # numpy fill the arrays instead of building them from Python lists.
+        blank = core._intern_sprixel(" ")
+        self._display_buffer = np.full(
+            (self.terminal.height, self.terminal.width), blank, dtype=object
         )
-        self._screen_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.terminal.width, 1)]
-                for j in range(0, self.terminal.height, 1)
-            ]
+        self._screen_buffer = np.full(
+            (self.terminal.height, self.terminal.width), blank, dtype=object
         )
         self._is_dirty = False
 
@@ -3308,17 +3306,12 @@ class Screen(object):
         Once the buffer is cleared nothing is left in it, you have to reposition (place)
         everything.
         """
-        self._display_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.terminal.width, 1)]
-                for j in range(0, self.terminal.height, 1)
-            ]
+        blank = core._intern_sprixel(" ")
+        self._display_buffer = np.full(
+            (self.terminal.height, self.terminal.width), blank, dtype=object
         )
-        self._screen_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.terminal.width, 1)]
-                for j in range(0, self.terminal.height, 1)
-            ]
+        self._screen_buffer = np.full(
+            (self.terminal.height, self.terminal.width), blank, dtype=object
         )
         self._is_dirty = False
 
@@ -3340,11 +3333,9 @@ class Screen(object):
         Once the buffer is cleared nothing is left in it, it sets the Screen for a
         rendering update.
         """
-        self._screen_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.terminal.width, 1)]
-                for j in range(0, self.terminal.height, 1)
-            ]
+        blank = core._intern_sprixel(" ")
+        self._screen_buffer = np.full(
+            (self.terminal.height, self.terminal.width), blank, dtype=object
         )
         self._is_dirty = True
 
@@ -3402,6 +3393,10 @@ class Screen(object):
            display. If :attr:`need_rendering` returns True, you need to manually call
            :func:`render()` before writing anything into the screen buffer. Or else it
            will be squashed in the next rendering cycle.
+
+        .. NOTE:: All the blank cells of a new (or cleared) buffer hold the same shared
+           :class:`~pygamelib.gfx.core.Sprixel` object. Treat it as read-only: replace
+           the cells, do not modify (or :func:`place()`) the sprixels they contain.
         """
         return self._screen_buffer
 
@@ -3490,18 +3485,16 @@ class Screen(object):
             col = display_buffer.shape[1] - 1
             while col >= 0:
                 i = display_buffer[row][col]
-                if (
-                    hasattr(i, "__rendering_pass")
-                    and getattr(i, "__rendering_pass") == 2
-                ):
-                    print(f"Deferred rendering for: {i}")
-                    second_pass.append({"item": i, "row": row, "column": col})
+                # One getattr() with a default instead of a hasattr()/getattr() pair.
+                if getattr(i, "__rendering_pass", 1) == 2:
+                    second_pass.append((i, row, col))
                     col -= 1
                     continue
-                if hasattr(i, "render_to_buffer"):
+                render_to_buffer = getattr(i, "render_to_buffer", None)
+                if render_to_buffer is not None:
                     # If the item is capable of rendering itself in the buffer, we let
                     # it do so.
-                    i.render_to_buffer(
+                    render_to_buffer(
                         screen_buffer,
                         row,
                         col,
@@ -3509,21 +3502,17 @@ class Screen(object):
                         s_width,
                     )
                 elif type(i) is str and len(i) > 1:
-                    idx = 0
-                    for char in i:
-                        if col + idx >= s_width:
-                            break
-                        screen_buffer[row][col + idx] = char
-                        idx += 1
+                    # Copy the whole (clamped) string in one slice assignment.
+                    end = min(col + len(i), s_width)
+                    screen_buffer[row][col:end] = list(i[: end - col])
                 elif hasattr(i, "__repr__"):
                     screen_buffer[row][col] = i.__repr__()
                 col -= 1
             row -= 1
-        for i in second_pass:
-            if hasattr(i["item"], "render_to_buffer"):
-                i["item"].render_to_buffer(
-                    screen_buffer, i["row"], i["column"], s_height, s_width
-                )
+        # Deferred items are stored as (item, row, column) tuples.
+        for i, i_row, i_col in second_pass:
+            if hasattr(i, "render_to_buffer"):
+                i.render_to_buffer(screen_buffer, i_row, i_col, s_height, s_width)
 
         self._is_dirty = False
 
@@ -3641,15 +3630,21 @@ class Screen(object):
            incompatible with the methods identified as being part of the **Direct
            Display** stack.
 
-        :param name: some param
-        :type name: str
+        Delete the element at the given position from the display buffer. The cell is
+        reset to a blank sprixel that is shared by all the blank cells of the screen (it
+        must be treated as read-only).
+
+        :param row: The row of the element to delete.
+        :type row: int
+        :param column: The column of the element to delete.
+        :type column: int
 
         Example::
 
-            method()
+            screen.delete(0, 0)
         """
         if row is not None and column is not None:
-            self._display_buffer[row][column] = core.Sprixel(" ")
+            self._display_buffer[row][column] = core._intern_sprixel(" ")
             self._is_dirty = True
 
     def display_line(self, *text, end="\n", file=sys.stdout, flush=False):
@@ -3795,9 +3790,10 @@ class Screen(object):
                                      int(screen.width/2)
                                      )
         """
+        null_sprixel = core._intern_sprixel()
         for r in range(0, sprite.size[1]):
             for c in range(0, sprite.size[0]):
-                if sprite._sprixels[r][c] == core.Sprixel():
+                if sprite._sprixels[r][c] == null_sprixel:
                     self.display_at(filler, row + r, column + c, file=file, flush=flush)
                 else:
                     self.display_at(
@@ -3835,9 +3831,10 @@ class Screen(object):
 
             screen.display_sprite(panda_sprite)
         """
+        null_sprixel = core._intern_sprixel()
         for r in range(0, sprite.size[1]):
             for c in range(0, sprite.size[0]):
-                if sprite._sprixels[r][c] == core.Sprixel():
+                if sprite._sprixels[r][c] == null_sprixel:
                     print(filler, end="")
                 else:
                     print(
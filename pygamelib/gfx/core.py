@@ -338,25 +338,32 @@ class Sprixel(object):
     def __init__(self, model="", bg_color=None, fg_color=None, is_bg_transparent=None):
         super().__init__()
         self.__color_cache = ""
+        # The complete ANSI representation of the sprixel. It is rebuilt by the model,
+        # bg_color and fg_color setters so __repr__() (called for each cell at each
+        # rendering) does not have to format anything.
+        self.__repr_cache = ""
         self.__bg_color = None
         self.__fg_color = None
         self.__length = 0
         self.model = model
-        self.__length = base.Console.instance().length(model)
+        # The colors are checked and set directly (instead of going through the
+        # setters) so the color cache is built only once.
         if bg_color is None or isinstance(bg_color, Color):
-            self.bg_color = bg_color
+            self.__bg_color = bg_color
         else:
             raise base.PglInvalidTypeException(
                 "Sprixel(model, bg_color, fg_color): bg_color needs to be a Color "
                 "object."
             )
         if fg_color is None or isinstance(fg_color, Color):
-            self.fg_color = fg_color
+            self.__fg_color = fg_color
         else:
             raise base.PglInvalidTypeException(
                 "Sprixel(model, bg_color, fg_color): fg_color needs to be a Color "
                 "object."
             )
+        if bg_color is not None or fg_color is not None:
+            self.__build_color_cache()
         self.is_bg_transparent = False
         if type(is_bg_transparent) is bool:
             self.is_bg_transparent = is_bg_transparent
@@ -366,7 +373,7 @@ class Sprixel(object):
             self.is_bg_transparent = True
 
     def __repr__(self):
-        return f"{self.__color_cache}{self.model}\x1b[0m"
+        return self.__repr_cache
 
     def __str__(self):  # pragma: no cover
         return self.__repr__()
@@ -379,6 +386,7 @@ class Sprixel(object):
         if self.fg_color is not None and isinstance(self.fg_color, Color):
             fgc = t.color_rgb(self.fg_color.r, self.fg_color.g, self.fg_color.b)
         self.__color_cache = f"{bgc}{fgc}"
+        self.__repr_cache = f"{self.__color_cache}{self.__model}\x1b[0m"
 
     def __eq__(self, other):
         if (
@@ -491,6 +499,7 @@ class Sprixel(object):
         if type(value) is str:
             self.__model = value
             self.__length = base.Console.instance().length(self.__model)
+            self.__repr_cache = f"{self.__color_cache}{self.__model}\x1b[0m"
         else:
             raise base.PglInvalidTypeException(
                 f"A Sprixel.model must be a string. {value} is not a string."
@@ -813,6 +822,28 @@ class Sprixel(object):
         return cls("  ", Color(255, 255, 0))
 
 
+# Hash-consing table for the colorless sprixels used by the rendering stack (blank
+# screen cells, null sprixels). Colors are left out on purpose: Color is mutable and
+# a shared sprixel would silently change (and go out of sync with its key) if its
+# Color object was modified.
+_sprixel_intern = {}
+
+
+def _intern_sprixel(model=""):
+    """Return a shared, colorless Sprixel for the given model.
+
+    The same object is returned for identical models. The shared sprixels end up in
+    the Screen buffers (see :attr:`pygamelib.engine.Screen.buffer` and
+    :func:`pygamelib.engine.Screen.delete`), they must be treated as read-only:
+    modifying one modifies it everywhere it is used.
+    """
+    sprix = _sprixel_intern.get(model)
+    if sprix is None:
+        sprix = Sprixel(model)
+        _sprixel_intern[model] = sprix
+    return sprix
+
+
 class Sprite(object):
     """
     The Sprite object represent a 2D "image" that can be used to represent any complex
@@ -1069,17 +1100,24 @@ class Sprite(object):
             # And can be used as formatted text
             notifications.push( f'You enter the dreaded village of {village_name}' )
         """
+        obj = cls(sprixels=Sprite._sprixels_from_text(text_object))
+        text_object._sprite_data = text_object.text
+        obj._initial_text_object = text_object
+        return obj
+
+    @staticmethod
+    def _sprixels_from_text(text_object):
+        # Build the 2D array of sprixels that represents a Text object. It is used by
+        # from_text() and by render_to_buffer() to refresh the sprixels when the text
+        # changes (without allocating a whole new Sprite).
         sprixels = []
         # TODO: why is it not style = text_object.style ?
         # style = ""
         # NOTE: I leave this TODO because I'm not sure exactly why it was put here and
         #       not changed immediately. There may be side effects.
         style = text_object.style
-        max_width = 0
         for line in text_object.text.splitlines():
             sprixels.append([])
-            if len(line) > max_width:
-                max_width = len(line)
             for char in line:
                 sprixels[-1].append(
                     Sprixel(
@@ -1088,10 +1126,7 @@ class Sprite(object):
                         text_object.fg_color,
                     )
                 )
-        obj = cls(sprixels=sprixels)
-        text_object._sprite_data = text_object.text
-        obj._initial_text_object = text_object
-        return obj
+        return sprixels
 
     @classmethod
     def load_from_ansi_file(cls, filename, default_sprixel=None):
@@ -1387,10 +1422,11 @@ class Sprite(object):
         elif ratio == 0.0:
             return
         # First let's set some var. o_ prefix original Sprite value n_ the new ones
-        o_height = self.height
-        o_width = self.width
-        n_height = int(ratio * self.height)
-        n_width = int(ratio * self.width)
+        # The width and height properties both recalculate the size, so we only do it
+        # once.
+        o_width, o_height = self.calculate_size()
+        n_height = int(ratio * o_height)
+        n_width = int(ratio * o_width)
         new_sprite = Sprite(
             size=[n_width, n_height],
             default_sprixel=self.default_sprixel,
@@ -1399,11 +1435,14 @@ class Sprite(object):
         # Now let's apply a nearest neighbor algorithm
         column_ratio = int((o_width << 16) / n_width) + 1
         row_ratio = int((o_height << 16) / n_height) + 1
+        # The source coordinates only depend on the destination column (resp. row), so
+        # they are computed once.
+        src_columns = [(j * column_ratio) >> 16 for j in range(0, n_width)]
+        sprixels = self._sprixels
+        new_sprixels = new_sprite._sprixels
         for i in range(0, n_height):
-            for j in range(0, n_width):
-                c2 = (j * column_ratio) >> 16
-                r2 = (i * row_ratio) >> 16
-                new_sprite.set_sprixel(i, j, self.sprixel(r2, c2))
+            src_row = sprixels[(i * row_ratio) >> 16]
+            new_sprixels[i] = [src_row[c2] for c2 in src_columns]
         return new_sprite
 
     def render_to_buffer(self, buffer, row, column, buffer_height, buffer_width):
@@ -1429,17 +1468,21 @@ class Sprite(object):
             self._initial_text_object is not None
             and self._initial_text_object._sprite_data != self._initial_text_object.text
         ):
-            i = Sprite.from_text(self._initial_text_object)
-            self._sprixels = i._sprixels
-            self._initial_text_object._sprite_data = i._initial_text_object._sprite_data
-            self.size = i.size
-            # display_buffer[row][col] = i
-        # Attempt at optimization.
-        null_sprixel = Sprixel()
-        get_sprixel = self.sprixel
+            text_object = self._initial_text_object
+            self._sprixels = Sprite._sprixels_from_text(text_object)
+            text_object._sprite_data = text_object.text
+            self.calculate_size()
+        # Attempt at optimization: the loops are clamped to the sprite and buffer
+        # boundaries so we can index the sprixels directly instead of going through
+        # the (checked) sprixel() accessor.
+        null_sprixel = _intern_sprixel()
+        sprixels = self._sprixels
+        col_end = min(self.size[0] + column, buffer_width)
         for sr in range(row, min(self.size[1] + row, buffer_height)):
-            for sc in range(column, min(self.size[0] + column, buffer_width)):
-                sprix = get_sprixel(sr - row, sc - column)
+            sprixels_row = sprixels[sr - row]
+            buffer_row = buffer[sr]
+            for sc in range(column, col_end):
+                sprix = sprixels_row[sc - column]
                 # Need to check the empty/null sprixel in the sprite
                 # because for the sprite we just skip and leave the
                 # sprixel that is behind but when it comes to screen we
@@ -1448,7 +1491,7 @@ class Sprite(object):
                     continue
                 # TODO: If the Sprite has sprixels with length > 1 this
                 # is going to be a mess.
-                buffer[sr][sc] = sprix.__repr__()
+                buffer_row[sc] = sprix.__repr__()
 
 
 class SpriteCollection(UserDict):
@@ -329,6 +329,33 @@ class TestBoard(unittest.TestCase):
         self.assertIsNone(self.board.display_around(i, 2, 2))
         self.assertIsNone(self.board.display())
 
+    def test_render_to_buffer_partial_display_wide_sprixels(self):
+        camera = pgl_board_items.Camera()
+        camera.row = 6
+        camera.column = 2
+        # With that focus and viewport, the board rows 4 to 7 are rendered.
+        board = pgl_engine.Board(
+            size=[4, 10],
+            enable_partial_display=True,
+            partial_display_viewport=[2, 2],
+            partial_display_focus=camera,
+            DISPLAY_SIZE_WARNINGS=False,
+        )
+        board.place_item(pgl_board_items.Wall(sprixel=gfx_core.Sprixel("##")), 5, 0)
+        board.place_item(pgl_board_items.Wall(sprixel=gfx_core.Sprixel("##")), 5, 3)
+        buffer = [["x" for c in range(0, 5)] for r in range(0, 6)]
+        board.render_to_buffer(buffer, 0, 0, 6, 5)
+        # Board row 5 is rendered on buffer row 1 (row_start is 4).
+        self.assertEqual(buffer[1][0], gfx_core.Sprixel("##").__repr__())
+        self.assertEqual(buffer[1][1], "")
+        self.assertEqual(buffer[1][4], gfx_core.Sprixel("##").__repr__())
+        # The second wide sprixel is clamped at the buffer width.
+        for r in range(0, 6):
+            self.assertEqual(len(buffer[r]), 5)
+            for c in range(0, 5):
+                if (r, c) != (1, 1):
+                    self.assertNotEqual(buffer[r][c], "")
+
 
 if __name__ == "__main__":
     unittest.main()
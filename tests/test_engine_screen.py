@@ -37,6 +37,30 @@ class TestBase(unittest.TestCase):
     def test_screen_create_good(self):
         scr = engine.Screen()
         self.assertIsInstance(scr, engine.Screen)
+        self.assertEqual(scr.buffer.shape, (scr.height, scr.width))
+        self.assertEqual(scr.buffer.dtype, object)
+
+    def test_screen_buffers_blank(self):
+        scr = engine.Screen()
+        blank = Sprixel(" ")
+
+        def check_blank(buffer):
+            self.assertEqual(buffer.shape, (scr.height, scr.width))
+            for r in range(0, scr.height):
+                for c in range(0, scr.width):
+                    self.assertEqual(buffer[r][c], blank)
+
+        check_blank(scr._display_buffer)
+        check_blank(scr.buffer)
+        scr.place("test", 0, 0)
+        scr.update()
+        scr.clear_buffers()
+        check_blank(scr._display_buffer)
+        check_blank(scr.buffer)
+        scr.place("test", 0, 0)
+        scr.update()
+        scr.clear_screen_buffer()
+        check_blank(scr.buffer)
 
     def test_clear(self):
         self.assertIsNone(self.screen.clear())
@@ -241,11 +241,18 @@ class TestBase(unittest.TestCase):
         spr2 = spr.scale(2)
         self.assertEqual(spr2.width, 6)
         self.assertEqual(spr2.height, 4)
+        self.assertEqual(spr2.sprixel(0, 0), gfx_core.Sprixel.cyan_rect())
+        self.assertEqual(spr2.sprixel(1, 1), gfx_core.Sprixel.cyan_rect())
+        self.assertEqual(spr2.sprixel(3, 5), gfx_core.Sprixel.white_rect())
+        self.assertEqual(spr2.sprixel(2, 3), gfx_core.Sprixel.blue_rect())
         spr3 = spr2.scale(0.5)
         self.assertEqual(spr3.width, 3)
         self.assertEqual(spr3.height, 2)
         self.assertEqual(spr3.width, spr.width)
         self.assertEqual(spr3.height, spr.height)
+        for r in range(0, spr.height):
+            for c in range(0, spr.width):
+                self.assertEqual(spr3.sprixel(r, c), spr.sprixel(r, c))
         self.assertEqual(spr, spr.scale(1))
         self.assertIsNone(spr.scale(0))
 
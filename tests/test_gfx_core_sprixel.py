@@ -85,6 +85,34 @@ class TestBase(unittest.TestCase):
         with self.assertRaises(gfx_core.base.PglInvalidTypeException):
             sprix.fg_color = 1
 
+    def test_sprixel_repr_update(self):
+        t = pgl_base.Console.instance()
+        sprix = gfx_core.Sprixel("@")
+        self.assertEqual(sprix.__repr__(), "@\x1b[0m")
+        sprix.model = "#"
+        self.assertEqual(sprix.__repr__(), "#\x1b[0m")
+        sprix.bg_color = gfx_core.Color(0, 0, 0)
+        sprix.fg_color = gfx_core.Color(1, 1, 1)
+        self.assertEqual(
+            sprix.__repr__(),
+            "".join([t.on_color_rgb(0, 0, 0), t.color_rgb(1, 1, 1), "#", "\x1b[0m"]),
+        )
+        sprix.bg_color = None
+        self.assertEqual(
+            sprix.__repr__(), "".join([t.color_rgb(1, 1, 1), "#", "\x1b[0m"])
+        )
+
+    def test_sprixel_intern(self):
+        s1 = gfx_core._intern_sprixel(" ")
+        s2 = gfx_core._intern_sprixel(" ")
+        s3 = gfx_core._intern_sprixel("#")
+        self.assertIs(s1, s2)
+        self.assertIsNot(s1, s3)
+        self.assertEqual(s1, gfx_core.Sprixel(" "))
+        self.assertIsNone(s1.bg_color)
+        self.assertIsNone(s1.fg_color)
+        self.assertIs(gfx_core._intern_sprixel(), gfx_core._intern_sprixel())
+
     def test_sprixel_static_black(self):
         s = gfx_core.Sprixel.black_rect()
         self.assertEqual(s.model, " ")